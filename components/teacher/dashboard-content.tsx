@@ -156,7 +156,7 @@ export function TeacherDashboardContent({ user, profile }: any) {
               <h2 className="text-3xl font-bold text-foreground">Welcome back, {profile?.full_name?.split(" ")[0]}</h2>
               <p className="text-muted-foreground">Manage your quizzes and track student progress</p>
             </div>
-            <Button onClick={() => setShowCreateModal(true)} size="lg">
+            <Button onClick={() => setShowCreateModal(true)} size="lg" data-testid="create-quiz">
               Create New Quiz
             </Button>
           </div>
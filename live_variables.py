@@ -1,25 +1,38 @@
 #!/usr/bin/env python3
 import argparse
 import ast
+import hashlib
+import io
+import os
+import pickle
 import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from functools import lru_cache, partial
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, TextIO, Tuple, TypeVar
 
 
 # A scope represents a region in the source code where variables can be defined and are visible.
-# We derive scope boundaries from AST nodes that introduce new scopes: Module, FunctionDef, AsyncFunctionDef, ClassDef.
+# We derive scope boundaries from AST nodes that introduce new scopes: Module, FunctionDef, AsyncFunctionDef, ClassDef,
+# and the comprehensions ListComp, SetComp, DictComp and GeneratorExp.
 
+T = TypeVar("T")
 
-@dataclass
+# (line, +1/-1, name): a name becomes available (+1) or stops being available (-1) at line
+Event = Tuple[int, int, str]
+
+
+@dataclass(slots=True)
 class Definition:
     name: str
     line: int
-    deleted_from: Optional[int] = None  # first line where name is deleted (no longer available)
+    deleted_from: int = sys.maxsize  # first line where name is deleted (no longer available); maxsize if never
 
 
-@dataclass
+@dataclass(slots=True)
 class Scope:
-    kind: str  # 'module' | 'function' | 'class'
+    kind: str  # 'module' | 'function' | 'class' | 'comprehension'
     name: str
     start_line: int
     end_line: int
@@ -27,6 +40,9 @@ class Scope:
     children: List["Scope"] = field(default_factory=list)
     # map name -> list of definitions (to handle re-definitions over time)
     definitions: Dict[str, List[Definition]] = field(default_factory=dict)
+    # filled by finalize(): per name, sorted definition lines and the matching deletion lines
+    def_lines: Dict[str, List[int]] = field(default_factory=dict)
+    del_lines: Dict[str, List[int]] = field(default_factory=dict)
 
     def add_definition(self, name: str, line: int) -> None:
         self.definitions.setdefault(name, []).append(Definition(name=name, line=line))
@@ -38,225 +54,485 @@ class Scope:
         # mark the latest definition as deleted from this line
         defs[-1].deleted_from = line
 
-    def available_names_at(self, line: int) -> Set[str]:
-        names: Set[str] = set()
+    def finalize(self, events: List[Event]) -> None:
+        # Definitions are recorded in traversal order, which is source order in practice;
+        # fall back to a stable sort for the rare out-of-order case (e.g. nested walrus).
         for name, defs in self.definitions.items():
-            # find the newest definition not after 'line'
-            latest: Optional[Definition] = None
-            for d in defs:
-                if d.line <= line and (latest is None or d.line > latest.line):
-                    latest = d
-            if latest is None:
-                continue
-            if latest.deleted_from is not None and latest.deleted_from <= line:
-                continue
-            names.add(name)
-        return names
+            lines = [d.line for d in defs]
+            if any(a > b for a, b in zip(lines, lines[1:])):
+                defs = sorted(defs, key=lambda d: d.line)
+                lines = [d.line for d in defs]
+            self.def_lines[name] = lines
+            self.del_lines[name] = [d.deleted_from for d in defs]
+            self._emit_events(name, events)
+
+    def _emit_events(self, name: str, events: List[Event]) -> None:
+        # Each definition is live from its line (never before the scope starts) until it is
+        # deleted, shadowed by the next definition, or the scope ends, whichever comes first.
+        lines = self.def_lines[name]
+        deletions = self.del_lines[name]
+        scope_exit = self.end_line + 1
+        for idx, line in enumerate(lines):
+            start = max(line, self.start_line)
+            stop = min(scope_exit, deletions[idx])
+            if idx + 1 < len(lines):
+                stop = min(stop, lines[idx + 1])
+            if start < stop:
+                events.append((start, 1, name))
+                events.append((stop, -1, name))
 
 
 def get_end_lineno(node: ast.AST) -> int:
-    # Python 3.8+ generally provides end_lineno, but fall back to lineno if missing
-    return getattr(node, "end_lineno", getattr(node, "lineno", 0)) or 0
-
-
-def build_scope_tree(tree: ast.AST) -> Scope:
-    module_scope = Scope(
-        kind="module",
-        name="<module>",
-        start_line=1,
-        end_line=get_end_lineno(tree) or 10 ** 9,
-        parent=None,
-    )
-
-    # Helper to enter scopes and record definitions
-    def visit(node: ast.AST, current: Scope) -> None:
-        # Handle new scopes
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            func_scope = Scope(
-                kind="function",
-                name=node.name,
-                start_line=node.lineno,
-                end_line=get_end_lineno(node),
-                parent=current,
-            )
-            current.children.append(func_scope)
-            # Function name is defined in the parent scope at def line
-            current.add_definition(node.name, node.lineno)
-            # Parameters are defined in the function scope at the function header line
-            for arg in list(node.args.posonlyargs) + list(node.args.args):
-                func_scope.add_definition(arg.arg, node.lineno)
-            if node.args.vararg is not None:
-                func_scope.add_definition(node.args.vararg.arg, node.lineno)
-            for arg in node.args.kwonlyargs:
-                func_scope.add_definition(arg.arg, node.lineno)
-            if node.args.kwarg is not None:
-                func_scope.add_definition(node.args.kwarg.arg, node.lineno)
-            # defaults annotated/values don't introduce local names (other than via assignment expressions), skip
-            # Visit body inside the function scope
-            for child in ast.iter_child_nodes(node):
-                # avoid re-visiting decorator list etc. but harmless
-                visit(child, func_scope)
-            return
-        if isinstance(node, ast.ClassDef):
-            class_scope = Scope(
-                kind="class",
-                name=node.name,
-                start_line=node.lineno,
-                end_line=get_end_lineno(node),
-                parent=current,
-            )
-            current.children.append(class_scope)
-            # Class name is defined in the parent scope
-            current.add_definition(node.name, node.lineno)
-            for child in ast.iter_child_nodes(node):
-                visit(child, class_scope)
-            return
+    # Parsed statements and expressions always carry end_lineno on Python 3.8+
+    return node.end_lineno if node.end_lineno is not None else node.lineno
+
+
+_COMPREHENSION_NAMES = {
+    ast.ListComp: "<listcomp>",
+    ast.SetComp: "<setcomp>",
+    ast.DictComp: "<dictcomp>",
+    ast.GeneratorExp: "<genexpr>",
+}
+
+
+class ScopeBuilder(ast.NodeVisitor):
+    """Builds the scope tree and the sweep-line events in a single pass over the AST."""
+
+    def __init__(self, module_end_line: int) -> None:
+        self.root = Scope(kind="module", name="<module>", start_line=1, end_line=module_end_line)
+        self.scope_stack: List[Scope] = [self.root]
+        self.events: List[Event] = []
+
+    @property
+    def current(self) -> Scope:
+        return self.scope_stack[-1]
+
+    def define_targets(self, target: ast.AST) -> None:
+        for name, line in iter_assigned_names(target):
+            self.current.add_definition(name, line)
+
+    def visit_scope(self, node: ast.AST, scope: Scope) -> None:
+        # Visit every child (decorators, defaults and body alike) inside the new scope,
+        # then turn its definitions into events now that the scope is complete
+        self.current.children.append(scope)
+        self.scope_stack.append(scope)
+        self.generic_visit(node)
+        self.scope_stack.pop()
+        scope.finalize(self.events)
+
+    def visit_Module(self, node: ast.Module) -> None:
+        self.generic_visit(node)
+        self.root.finalize(self.events)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        func_scope = Scope(
+            kind="function",
+            name=node.name,
+            start_line=node.lineno,
+            end_line=get_end_lineno(node),
+            parent=self.current,
+        )
+        # Function name is defined in the parent scope at def line
+        self.current.add_definition(node.name, node.lineno)
+        # Parameters are defined in the function scope at the function header line
+        for arg in list(node.args.posonlyargs) + list(node.args.args):
+            func_scope.add_definition(arg.arg, node.lineno)
+        if node.args.vararg is not None:
+            func_scope.add_definition(node.args.vararg.arg, node.lineno)
+        for arg in node.args.kwonlyargs:
+            func_scope.add_definition(arg.arg, node.lineno)
+        if node.args.kwarg is not None:
+            func_scope.add_definition(node.args.kwarg.arg, node.lineno)
+        # defaults annotated/values don't introduce local names (other than via assignment expressions), skip
+        self.visit_scope(node, func_scope)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        class_scope = Scope(
+            kind="class",
+            name=node.name,
+            start_line=node.lineno,
+            end_line=get_end_lineno(node),
+            parent=self.current,
+        )
+        # Class name is defined in the parent scope
+        self.current.add_definition(node.name, node.lineno)
+        self.visit_scope(node, class_scope)
+
+    def visit_ListComp(self, node: ast.AST) -> None:
+        comp_scope = Scope(
+            kind="comprehension",
+            name=_COMPREHENSION_NAMES[type(node)],
+            start_line=node.lineno,
+            end_line=get_end_lineno(node),
+            parent=self.current,
+        )
+        # Loop targets are local to the comprehension and don't leak into the enclosing scope
+        for generator in node.generators:
+            for name, line in iter_assigned_names(generator.target):
+                comp_scope.add_definition(name, line)
+        self.visit_scope(node, comp_scope)
+
+    visit_SetComp = visit_ListComp
+    visit_DictComp = visit_ListComp
+    visit_GeneratorExp = visit_ListComp
+
+    # Record definitions and deletions within the current scope, then recurse
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        for target in node.targets:
+            self.define_targets(target)
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        if node.target is not None:
+            self.define_targets(node.target)
+        self.generic_visit(node)
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        self.define_targets(node.target)
+        self.generic_visit(node)
+
+    def visit_NamedExpr(self, node: ast.NamedExpr) -> None:  # walrus operator inside expressions
+        # Inside a comprehension the walrus binds in the nearest enclosing non-comprehension scope
+        scope = self.current
+        while scope.kind == "comprehension" and scope.parent is not None:
+            scope = scope.parent
+        for name, line in iter_assigned_names(node.target):
+            scope.add_definition(name, line)
+        self.generic_visit(node)
+
+    def visit_For(self, node: ast.For) -> None:
+        self.define_targets(node.target)
+        self.generic_visit(node)
+
+    visit_AsyncFor = visit_For
+
+    def visit_With(self, node: ast.With) -> None:
+        for item in node.items:
+            if item.optional_vars is not None:
+                self.define_targets(item.optional_vars)
+        self.generic_visit(node)
+
+    visit_AsyncWith = visit_With
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            # import x as y -> defines y else x
+            defined = alias.asname or alias.name.split(".")[0]
+            self.current.add_definition(defined, node.lineno)
+        self.generic_visit(node)
+
+    visit_ImportFrom = visit_Import
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
+        if node.name:
+            self.current.add_definition(node.name, node.lineno)
+        self.generic_visit(node)
+
+    def visit_Delete(self, node: ast.Delete) -> None:
+        for target in node.targets:
+            for name, line in iter_assigned_names(target):
+                self.current.add_deletion(name, node.lineno)
+        self.generic_visit(node)
+
+
+def build_scope_tree(tree: ast.AST) -> Tuple[Scope, List[Event]]:
+    # ast.Module has no position info; the module scope extends past the last line so
+    # module-level names stay visible on trailing blank and comment lines
+    builder = ScopeBuilder(10 ** 9)
+    builder.visit(tree)
+    return builder.root, builder.events
+
+
+def _target_name(t: ast.Name, names: List[Tuple[str, int]], stack: List[ast.AST]) -> None:
+    names.append((t.id, t.lineno))
+
+
+def _target_sequence(t: ast.AST, names: List[Tuple[str, int]], stack: List[ast.AST]) -> None:
+    # reversed so elements pop off the stack in source order
+    stack.extend(reversed(t.elts))
+
+
+def _target_starred(t: ast.Starred, names: List[Tuple[str, int]], stack: List[ast.AST]) -> None:
+    stack.append(t.value)
+
 
-        # Record definitions and deletions within current scope
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                for name, line in iter_assigned_names(target):
-                    current.add_definition(name, line)
-        elif isinstance(node, ast.AnnAssign):
-            if node.target is not None:
-                for name, line in iter_assigned_names(node.target):
-                    current.add_definition(name, line)
-        elif isinstance(node, ast.AugAssign):
-            for name, line in iter_assigned_names(node.target):
-                current.add_definition(name, line)
-        elif isinstance(node, ast.NamedExpr):  # walrus operator inside expressions
-            for name, line in iter_assigned_names(node.target):
-                current.add_definition(name, line)
-        elif isinstance(node, ast.For):
-            for name, line in iter_assigned_names(node.target):
-                current.add_definition(name, line)
-        elif isinstance(node, ast.AsyncFor):
-            for name, line in iter_assigned_names(node.target):
-                current.add_definition(name, line)
-        elif isinstance(node, ast.With):
-            for item in node.items:
-                if item.optional_vars is not None:
-                    for name, line in iter_assigned_names(item.optional_vars):
-                        current.add_definition(name, line)
-        elif isinstance(node, ast.AsyncWith):
-            for item in node.items:
-                if item.optional_vars is not None:
-                    for name, line in iter_assigned_names(item.optional_vars):
-                        current.add_definition(name, line)
-        elif isinstance(node, (ast.Import, ast.ImportFrom)):
-            for alias in node.names:
-                # import x as y -> defines y else x
-                defined = alias.asname or alias.name.split(".")[0]
-                current.add_definition(defined, node.lineno)
-        elif isinstance(node, ast.ExceptHandler):
-            if node.name:
-                current.add_definition(node.name, node.lineno)
-        elif isinstance(node, ast.comprehension):
-            for name, line in iter_assigned_names(node.target):
-                current.add_definition(name, line)
-        elif isinstance(node, ast.Delete):
-            for target in node.targets:
-                for name, line in iter_assigned_names(target):
-                    current.add_deletion(name, node.lineno)
-
-        # Recurse
-        for child in ast.iter_child_nodes(node):
-            visit(child, current)
-
-    visit(tree, module_scope)
-    return module_scope
+# Dispatch on the exact node type. Attribute and Subscript targets (and anything else)
+# do not create names in scope and are simply skipped.
+_TARGET_HANDLERS = {
+    ast.Name: _target_name,
+    ast.Tuple: _target_sequence,
+    ast.List: _target_sequence,
+    ast.Starred: _target_starred,
+}
 
 
 def iter_assigned_names(target: ast.AST) -> List[Tuple[str, int]]:
+    # Only called on assignment/deletion targets, so every Name found here is bound (or
+    # unbound by del) by the statement; its ctx does not need to be checked.
     names: List[Tuple[str, int]] = []
-    def _visit(t: ast.AST):
-        if isinstance(t, ast.Name) and isinstance(t.ctx, (ast.Store, ast.Param)):
-            names.append((t.id, t.lineno))
-        elif isinstance(t, (ast.Tuple, ast.List)):
-            for elt in t.elts:
-                _visit(elt)
-        elif isinstance(t, ast.Attribute):
-            # attribute assignments do not create names in scope
-            return
-        elif isinstance(t, ast.Subscript):
-            return
-        elif isinstance(t, ast.Starred):
-            _visit(t.value)
-        # Ignore others
-    _visit(target)
+    stack = [target]
+    while stack:
+        t = stack.pop()
+        handler = _TARGET_HANDLERS.get(type(t))
+        if handler is not None:
+            handler(t, names, stack)
     return names
 
 
-def scope_stack_at(scope: Scope, line: int) -> List[Scope]:
-    stack: List[Scope] = []
+@dataclass
+class LineSnapshots:
+    """Names available per line, stored only at the lines where they change."""
+
+    total_lines: int
+    # change_lines[k] is the first line at which snapshots[k] applies (sorted ascending)
+    change_lines: List[int] = field(default_factory=list)
+    snapshots: List[FrozenSet[str]] = field(default_factory=list)
 
-    def dfs(s: Scope):
-        if not (s.start_line <= line <= s.end_line):
-            return False
-        stack.append(s)
-        for child in s.children:
-            if dfs(child):
-                break
-        return True
+    def __len__(self) -> int:
+        return self.total_lines
 
-    dfs(scope)
-    return stack
+    def __getitem__(self, line: int) -> FrozenSet[str]:
+        idx = bisect_right(self.change_lines, line) - 1
+        if idx < 0:
+            return frozenset()
+        return self.snapshots[idx]
 
 
-def compute_available_variables_per_line(source: str) -> Dict[int, Set[str]]:
+@lru_cache(maxsize=8)
+def compute_available_variables_per_line(source: str) -> LineSnapshots:
     tree = ast.parse(source)
-    root_scope = build_scope_tree(tree)
-    lines = source.splitlines()
-    result: Dict[int, Set[str]] = {}
-    for i in range(1, len(lines) + 1):
-        stack = scope_stack_at(root_scope, i)
-        names: Set[str] = set()
-        for s in stack:
-            names |= s.available_names_at(i)
-        result[i] = names
+    _, events = build_scope_tree(tree)
+    total_lines = len(source.splitlines())
+    events.sort(key=lambda ev: ev[0])
+
+    # Sweep the events once in line order, keeping a refcount per name (a name may be live
+    # in several nested scopes at once) and only recording a snapshot where the live set
+    # changes. Identical snapshots (e.g. the module scope before and after a function) are
+    # interned so every line with the same names shares one frozenset.
+    live: Dict[str, int] = {}
+    snapshot: FrozenSet[str] = frozenset()
+    interned: Dict[FrozenSet[str], FrozenSet[str]] = {snapshot: snapshot}
+    result = LineSnapshots(total_lines=total_lines)
+    pos = 0
+    while pos < len(events) and events[pos][0] <= total_lines:
+        line = events[pos][0]
+        changed = False
+        while pos < len(events) and events[pos][0] == line:
+            _, delta, name = events[pos]
+            count = live.get(name, 0) + delta
+            if count:
+                live[name] = count
+            else:
+                del live[name]
+            if count == 0 or (delta > 0 and count == 1):
+                changed = True
+            pos += 1
+        if changed:
+            snapshot = frozenset(live)
+            snapshot = interned.setdefault(snapshot, snapshot)
+            if not result.snapshots or result.snapshots[-1] is not snapshot:
+                result.change_lines.append(line)
+                result.snapshots.append(snapshot)
     return result
 
 
-def print_table(available: Dict[int, Set[str]], fmt: str, path: str, total_lines: int) -> None:
+# Bump whenever the analysis changes so stale on-disk results are recomputed
+CACHE_VERSION = 3
+
+
+def get_cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "live_variables")
+
+
+def compute_from_path(path: str, use_cache: bool = True) -> LineSnapshots:
+    # Results are cached on disk per file and reused while its mtime and size are unchanged
+    st = os.stat(path)
+    key = (CACHE_VERSION, st.st_mtime_ns, st.st_size)
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+    cache_path = os.path.join(get_cache_dir(), f"{digest}.pkl")
+    if use_cache:
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, cached = pickle.load(f)
+            if cached_key == key:
+                return cached
+        except Exception:
+            # missing, unreadable or corrupt cache entry: recompute below
+            pass
+
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    available = compute_available_variables_per_line(source)
+
+    if use_cache:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump((key, available), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    return available
+
+
+# Output is flushed to stdout in blocks of roughly this many characters
+WRITE_CHUNK_SIZE = 64 * 1024
+
+
+def write_lines(lines: Iterable[str], out: TextIO) -> None:
+    # Batch rows into few large writes instead of one print() per row
+    buf: List[str] = []
+    size = 0
+    for line in lines:
+        buf.append(line)
+        size += len(line) + 1
+        if size >= WRITE_CHUNK_SIZE:
+            out.write("\n".join(buf))
+            out.write("\n")
+            buf.clear()
+            size = 0
+    if buf:
+        out.write("\n".join(buf))
+        out.write("\n")
+
+
+def render_per_line(available: LineSnapshots, total_lines: int, render: Callable[[FrozenSet[str]], T]) -> Iterator[T]:
+    # Lines share interned snapshots, so render (sort + join) each distinct snapshot once
+    rendered: Dict[FrozenSet[str], T] = {}
+    for i in range(1, total_lines + 1):
+        snapshot = available[i]
+        value = rendered.get(snapshot)
+        if value is None:
+            value = rendered[snapshot] = render(snapshot)
+        yield value
+
+
+CSV_HEADER = "line,variables"
+CSV_MULTI_HEADER = "file,line,variables"
+
+
+def print_table(
+    available: LineSnapshots,
+    fmt: str,
+    path: str,
+    total_lines: int,
+    out: Optional[TextIO] = None,
+    multi: bool = False,
+) -> None:
+    # multi=True formats one file of a multi-file run: CSV rows get a leading file column and
+    # no header, and JSON is written without a trailing newline so main() can join the
+    # documents into one array
+    if out is None:
+        out = sys.stdout
     if fmt == "csv":
-        print("line,variables")
-        for i in range(1, total_lines + 1):
-            vars_str = ";".join(sorted(available.get(i, set())))
-            print(f"{i},\"{vars_str}\"")
+        # the path is the only field that may need escaping; quote it once per file
+        prefix = '"' + path.replace('"', '""') + '",' if multi else ""
+
+        def csv_rows() -> Iterator[str]:
+            if not multi:
+                yield CSV_HEADER
+            vars_strs = render_per_line(available, total_lines, lambda names: ";".join(sorted(names)))
+            # Python identifiers never contain quotes, commas or newlines, so wrapping the
+            # joined names in quotes is already valid CSV; csv.writer would rescan every
+            # field for characters to escape and is several times slower here
+            for i, vars_str in enumerate(vars_strs, 1):
+                yield f"{prefix}{i},\"{vars_str}\""
+        write_lines(csv_rows(), out)
         return
     if fmt == "json":
         import json
-        obj = {str(i): sorted(list(available.get(i, set()))) for i in range(1, total_lines + 1)}
-        print(json.dumps({"file": path, "lines": obj}, indent=2))
+        sorted_names = render_per_line(available, total_lines, sorted)
+        obj = {str(i): names for i, names in enumerate(sorted_names, 1)}
+        # one dumps() + write is about twice as fast as json.dump(), which issues a
+        # separate write() for every token when indenting
+        out.write(json.dumps({"file": path, "lines": obj}, indent=2))
+        if not multi:
+            out.write("\n")
         return
     # pretty table
     width = len(str(total_lines))
     header_line = f"{'line'.rjust(width)} | variables"
-    sep = f"{'-' * width}-+{"-" * 1}----------------------------"
-    print(header_line)
-    print("-" * len(header_line))
-    for i in range(1, total_lines + 1):
-        vars_str = ", ".join(sorted(available.get(i, set())))
-        print(f"{str(i).rjust(width)} | {vars_str}")
+
+    def table_rows() -> Iterator[str]:
+        yield header_line
+        yield "-" * len(header_line)
+        vars_strs = render_per_line(available, total_lines, lambda names: ", ".join(sorted(names)))
+        for i, vars_str in enumerate(vars_strs, 1):
+            yield f"{str(i).rjust(width)} | {vars_str}"
+    write_lines(table_rows(), out)
+
+
+def describe_error(path: str, e: Exception) -> str:
+    if isinstance(e, SyntaxError):
+        return f"error: could not parse file '{path}': {e}"
+    return f"error: could not read file '{path}': {e}"
+
+
+def process_file(path: str, fmt: str, use_cache: bool = True) -> Tuple[str, Optional[str]]:
+    # Returns (formatted output, error message); runs in a worker process for multi-file runs.
+    # A file that cannot be read, decoded or parsed is reported without stopping the others.
+    try:
+        available = compute_from_path(path, use_cache=use_cache)
+    except (OSError, SyntaxError, ValueError) as e:
+        return "", describe_error(path, e)
+    out = io.StringIO()
+    print_table(available, fmt, path, len(available), out, multi=True)
+    return out.getvalue(), None
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description="List available variables per line for a Python source file.")
-    parser.add_argument("path", help="Path to a Python source file")
+    parser = argparse.ArgumentParser(description="List available variables per line for Python source files.")
+    parser.add_argument("paths", nargs="+", metavar="path", help="Path to a Python source file")
     parser.add_argument("--format", "-f", choices=["table", "csv", "json"], default="table", help="Output format")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the on-disk result cache")
     args = parser.parse_args()
+    use_cache = not args.no_cache
+
+    if len(args.paths) == 1:
+        path = args.paths[0]
+        try:
+            available = compute_from_path(path, use_cache=use_cache)
+        except (OSError, SyntaxError, ValueError) as e:
+            print(describe_error(path, e), file=sys.stderr)
+            sys.exit(1)
+        print_table(available, args.format, path, len(available))
+        return
 
-    try:
-        with open(args.path, "r", encoding="utf-8") as f:
-            source = f.read()
-    except OSError as e:
-        print(f"error: could not read file '{args.path}': {e}", file=sys.stderr)
+    # Several files: analyze them in parallel worker processes, print in argument order.
+    # CSV gets one header and a file column; JSON becomes one array of per-file objects.
+    work = partial(process_file, fmt=args.format, use_cache=use_cache)
+    workers = min(len(args.paths), os.cpu_count() or 1)
+    # several tasks per worker keeps every process busy without one IPC round trip per file
+    chunksize = max(1, len(args.paths) // (workers * 4))
+    failed = False
+    first = True
+    if args.format == "csv":
+        sys.stdout.write(CSV_MULTI_HEADER + "\n")
+    elif args.format == "json":
+        sys.stdout.write("[")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for path, (output, error) in zip(args.paths, executor.map(work, args.paths, chunksize=chunksize)):
+            if error is not None:
+                print(error, file=sys.stderr)
+                failed = True
+                continue
+            if args.format == "json":
+                # JSON strings never contain raw newlines, so this only indents structure
+                output = ("\n  " if first else ",\n  ") + output.replace("\n", "\n  ")
+            elif args.format == "table":
+                sys.stdout.write(f"==> {path} <==\n")
+            sys.stdout.write(output)
+            first = False
+    if args.format == "json":
+        sys.stdout.write("]\n" if first else "\n]\n")
+    if failed:
         sys.exit(1)
 
-    available = compute_available_variables_per_line(source)
-    total_lines = len(source.splitlines())
-    print_table(available, args.format, args.path, total_lines)
-
 
 if __name__ == "__main__":
     main()
@@ -1,58 +1,72 @@
+from gevent.pool import Pool
 from locust import HttpUser, task, between
 
 
+# Target the deployed site directly so you can run without passing --host
+HOST = "https://quiz-master-bay.vercel.app"
+
+HOMEPAGE_URL = "/"
+LOGIN_URL = "/auth/login"
+SIGNUP_URL = "/auth/sign-up"
+JOIN_QUIZ_URL = "/student/join-quiz"
+STUDENT_DASHBOARD_URL = "/student/dashboard"
+TEACHER_DASHBOARD_URL = "/teacher/dashboard"
+NONEXISTENT_URL = "/nonexistent-route-for-load-test"
+
+MAIN_PAGES = (HOMEPAGE_URL, LOGIN_URL, SIGNUP_URL, JOIN_QUIZ_URL)
+
+
 class QuizMasterUser(HttpUser):
     """Simulates a typical user browsing key pages of QuizMaster."""
 
     # Set wait time between tasks to simulate realistic user pacing
     wait_time = between(1, 3)
 
-    # Target the deployed site directly so you can run without passing --host
-    host = "https://quiz-master-bay.vercel.app"
+    host = HOST
 
     @task(5)
     def visit_homepage(self):
-        self.client.get("/")
+        self.client.get(HOMEPAGE_URL, name=HOMEPAGE_URL)
 
     @task(3)
     def visit_login(self):
-        self.client.get("/auth/login")
+        self.client.get(LOGIN_URL, name=LOGIN_URL)
 
     @task(2)
     def visit_signup(self):
-        self.client.get("/auth/sign-up")
+        self.client.get(SIGNUP_URL, name=SIGNUP_URL)
 
     @task(3)
     def browse_student_join_quiz(self):
-        self.client.get("/student/join-quiz")
+        self.client.get(JOIN_QUIZ_URL, name=JOIN_QUIZ_URL)
 
     @task(2)
     def browse_student_dashboard(self):
         # This page may require auth; if unauthorized, Locust will still record response metrics
-        self.client.get("/student/dashboard")
+        self.client.get(STUDENT_DASHBOARD_URL, name=STUDENT_DASHBOARD_URL)
 
     @task(2)
     def browse_teacher_dashboard(self):
         # This page may require auth; if unauthorized, Locust will still record response metrics
-        self.client.get("/teacher/dashboard")
+        self.client.get(TEACHER_DASHBOARD_URL, name=TEACHER_DASHBOARD_URL)
 
     @task(1)
     def hit_nonexistent_route(self):
         # Lightly exercise error paths/404 handling
-        self.client.get("/nonexistent-route-for-load-test", name="/nonexistent")
+        self.client.get(NONEXISTENT_URL, name="/nonexistent")
 
 
 class FastBrowsingUser(HttpUser):
     """Simulates a faster user with shorter waits, stressing the server harder."""
 
     wait_time = between(0.3, 1.0)
-    host = "https://quiz-master-bay.vercel.app"
+    host = HOST
 
     @task(6)
     def cycle_main_pages(self):
-        self.client.get("/")
-        self.client.get("/auth/login")
-        self.client.get("/auth/sign-up")
-        self.client.get("/student/join-quiz")
-
-
+        # Fetch the main pages concurrently (Locust already runs on gevent), so the task
+        # takes as long as the slowest page rather than the sum of all four
+        pool = Pool(len(MAIN_PAGES))
+        for url in MAIN_PAGES:
+            pool.spawn(self.client.get, url, name=url)
+        pool.join()
@@ -35,6 +35,7 @@ FEATURES:
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
@@ -47,11 +48,146 @@ from selenium.common.exceptions import (
 )
 import time
 import json
+import re
+import threading
+from dataclasses import dataclass, asdict
 from datetime import datetime
 from typing import List, Dict, Tuple
+from urllib.parse import urldefrag, urlsplit, urlunsplit
 import sys
 
+def _canon(url: str) -> str:
+    """Canonical form of a URL, used only as the crawl dedup key: drop query and fragment, strip trailing slash"""
+    s = urlsplit(url)
+    return urlunsplit((s.scheme, s.netloc, s.path.rstrip('/') or '/', '', ''))
+
+
+@dataclass(slots=True)
+class TestRecord:
+    """One logged test result; converted to a dict only when written as JSON"""
+    test: str
+    status: str
+    message: str
+    url: str
+    elapsed: float  # seconds since the run started
+    element_type: str
+
+
 class QuizMasterTester:
+    # Max seconds to wait for a click to navigate or re-render before moving on
+    CLICK_SETTLE_TIMEOUT = 1
+    # Max seconds to wait for a button click to navigate, re-render the page or open a dialog
+    BUTTON_EFFECT_TIMEOUT = 2
+    # Max seconds to wait for a form element that should already be on the page
+    FIND_TIMEOUT = 2
+    # Fail fast on hung resources instead of Chrome's 300s default
+    PAGE_LOAD_TIMEOUT = 15
+    SCRIPT_TIMEOUT = 10
+    # Console lines buffered by log_result before one write to stdout
+    LOG_FLUSH_LINES = 64
+    # Seconds a saved login session (.cookies_<email>.json) is reused before logging in again
+    SESSION_CACHE_TTL = 3600
+    # Buttons that would end the session or destroy data are not clicked while crawling
+    DESTRUCTIVE_BUTTON_RE = re.compile(r"logout|log out|delete|remove", re.IGNORECASE)
+    # Links to downloads/assets are not pages and are never crawled
+    ASSET_EXTENSIONS = ('.pdf', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.zip', '.csv')
+
+    # Returns every element matching arguments[0] with the properties the tests need, so a
+    # page is inspected in one WebDriver round trip instead of several per element
+    ELEMENT_INFO_SCRIPT = """
+        return Array.from(document.querySelectorAll(arguments[0]), function (e) {
+            return {
+                el: e,
+                visible: !!(e.offsetParent || e.getClientRects().length),
+                enabled: e.disabled !== true,
+                text: (e.innerText || "").trim().slice(0, 50),
+                tag: e.tagName.toLowerCase(),
+                type: e.type || "",
+                href: typeof e.href === "string" ? e.href : "",
+                id: e.id || "",
+                name: e.getAttribute("name") || ""
+            };
+        });
+    """
+    # Returns the fields of form arguments[0] with the metadata test_all_forms needs
+    FORM_INPUTS_SCRIPT = """
+        return Array.from(arguments[0].querySelectorAll("input, textarea, select"), function (e) {
+            return {
+                el: e,
+                tag: e.tagName.toLowerCase(),
+                type: e.type || "",
+                name: e.getAttribute("name") || "",
+                visible: !!(e.offsetParent || e.getClientRects().length)
+            };
+        });
+    """
+    REPORT_TEMPLATE = """
+{rule}
+QUIZMASTER COMPREHENSIVE TEST REPORT
+{rule}
+Generated: {generated}
+Base URL: {base_url}
+
+SUMMARY:
+--------
+Total Tests: {total}
+Passed: {passed} ({passed_pct:.1f}%)
+Failed: {failed} ({failed_pct:.1f}%)
+Warnings: {warnings} ({warnings_pct:.1f}%)
+Pass Rate: {pass_rate:.1f}%
+
+Elements Tested: {elements}
+
+PASSED TESTS ({passed}):
+--------------
+{passed_lines}
+FAILED TESTS ({failed}):
+---------------
+{failed_lines}
+WARNINGS ({warnings}):
+---------
+{warning_lines}
+{rule}
+"""
+    # Sets arguments[0].value to arguments[1] in one round trip. Uses the prototype's native value
+    # setter so React-controlled inputs see the change, then fires input and change events
+    JS_TYPE_SCRIPT = """
+        var e = arguments[0];
+        var desc = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(e), "value");
+        if (desc && desc.set) { desc.set.call(e, arguments[1]); } else { e.value = arguments[1]; }
+        e.dispatchEvent(new Event("input", {bubbles: true}));
+        e.dispatchEvent(new Event("change", {bubbles: true}));
+    """
+    # Cheap structural fingerprint of the rendered page, so routes that render the same
+    # component (e.g. dashboard tabs) are only exercised once
+    PAGE_SIGNATURE_SCRIPT = (
+        "return document.body.innerHTML.length + ':' + document.querySelectorAll('button,input,a').length;"
+    )
+    LINK_HREFS_SCRIPT = "return Array.from(document.querySelectorAll('a[href]'), function (a) { return a.href; });"
+
+    # Resources blocked with FAST_CRAWL=1: images, fonts, media and analytics are never
+    # inspected by the tests. Stylesheets stay enabled since visibility checks depend on them.
+    FAST_CRAWL_BLOCKED_URLS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf",
+        "*.mp4", "*.webm", "*.mp3",
+    ]
+    # Analytics/ad requests are pure overhead for the tests and are always blocked
+    TRACKER_BLOCKED_URLS = [
+        "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*",
+        "*hotjar.com*", "*segment.io*", "*segment.com*",
+        "*/_vercel/insights/*",
+    ]
+
+    # Locators used across tests (CSS / ID lookups are native and faster than XPath)
+    BODY = (By.TAG_NAME, "body")
+    EMAIL_INPUT = (By.ID, "email")
+    PASSWORD_INPUT = (By.ID, "password")
+    SUBMIT_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
+    TABS = (By.CSS_SELECTOR, "[role='tab'], button[data-state]")
+    CREATE_QUIZ_BUTTON = (By.CSS_SELECTOR, "[data-testid='create-quiz']")
+    CREATE_QUIZ_BUTTON_FALLBACK = (By.XPATH, "//button[contains(text(), 'Create')]")
+
     def __init__(self, base_url: str = "https://quiz-master-bay.vercel.app"):
         self.base_url = base_url
         self.results = {
@@ -62,35 +198,90 @@ class QuizMasterTester:
             "timestamp": datetime.now().isoformat()
         }
         self.driver = None
+        # Signatures of pages whose elements were already exercised; shared with worker testers
+        self._page_sigs = set()
+        self._page_sigs_lock = threading.Lock()
+        # (canonical url, action) pairs already run, so public pages re-visited by later tests are skipped
+        self._done = set()
+        self._done_lock = threading.Lock()
+        # Newline-delimited JSON stream of results, written as they are logged (see setup_driver)
+        self._ndjson = None
+        self._ndjson_lock = threading.Lock()
+        # Console output is batched (see log_result); records carry seconds since this start time
+        self._start = time.monotonic()
+        self._out_buf = []
+        self._out_lock = threading.Lock()
         
-    def setup_driver(self):
-        """Setup Chrome WebDriver with options"""
+    def create_driver(self, headless: bool = False, profile_dir: str = ".chrome-profile"):
+        """Create a new Chrome WebDriver with options.
+
+        The browser keeps its HTTP cache in profile_dir between runs so framework bundles are not
+        re-downloaded; a profile directory can only be used by one browser at a time.
+        """
         chrome_options = Options()
         # Visible browser by default so it takes control of the computer.
         # Use HEADLESS=1 env to run headless if desired.
         import os
-        if os.environ.get("HEADLESS", "0") == "1":
+        if headless or os.environ.get("HEADLESS", "0") == "1":
             chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        chrome_options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
+        chrome_options.add_argument("--profile-directory=Default")
+        chrome_options.add_argument("--disk-cache-size=209715200")
+        # Use FAST_CRAWL=1 env to also skip loading images, fonts and media while crawling
+        fast_crawl = os.environ.get("FAST_CRAWL", "0") == "1"
+        # Return from driver.get() at DOMContentLoaded rather than waiting for every subresource
+        chrome_options.page_load_strategy = "eager"
+        if fast_crawl:
+            chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
         
+        # Try using webdriver-manager if available
         try:
-            # Try using webdriver-manager if available
-            try:
-                from webdriver_manager.chrome import ChromeDriverManager
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            except ImportError:
-                # Fallback to system ChromeDriver
-                self.driver = webdriver.Chrome(options=chrome_options)
+            from webdriver_manager.chrome import ChromeDriverManager
+            service = Service(ChromeDriverManager().install())
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        except ImportError:
+            # Fallback to system ChromeDriver
+            driver = webdriver.Chrome(options=chrome_options)
+        
+        try:
+            blocked_urls = self.TRACKER_BLOCKED_URLS + (self.FAST_CRAWL_BLOCKED_URLS if fast_crawl else [])
+            driver.execute_cdp_cmd("Network.enable", {})
+            # Only the cache should carry over from the profile: sessions come from login()/login_from_cache(),
+            # and a leftover session would make /auth/login redirect away from the login form
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
             
-            self.driver.implicitly_wait(5)
+            driver.set_page_load_timeout(self.PAGE_LOAD_TIMEOUT)
+            driver.set_script_timeout(self.SCRIPT_TIMEOUT)
+        except Exception:
+            # Don't leave a running browser behind that nobody will quit
+            driver.quit()
+            raise
+        # No implicit wait: lookups that may legitimately miss return immediately, and
+        # required elements use explicit waits (see find_element)
+        return driver
+
+    def setup_driver(self):
+        """Setup Chrome WebDriver with options"""
+        # Open the results stream before starting Chrome so a failure here leaves no browser behind
+        ndjson_filename = f"test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+        try:
+            self._ndjson = open(ndjson_filename, "w")
+        except OSError as e:
+            print(f"Error opening results file {ndjson_filename}: {e}")
+            return False
+        try:
+            self.driver = self.create_driver()
             self.wait = WebDriverWait(self.driver, 10)
             return True
         except Exception as e:
+            self._ndjson.close()
+            self._ndjson = None
             print(f"Error setting up driver: {e}")
             print("Make sure ChromeDriver is installed and in PATH")
             print("Or install webdriver-manager: pip install webdriver-manager")
@@ -98,14 +289,14 @@ class QuizMasterTester:
     
     def log_result(self, test_name: str, status: str, message: str = "", element_type: str = ""):
         """Log test result"""
-        result = {
-            "test": test_name,
-            "status": status,
-            "message": message,
-            "url": self.driver.current_url if self.driver else "",
-            "timestamp": datetime.now().isoformat(),
-            "element_type": element_type
-        }
+        result = TestRecord(
+            test=test_name,
+            status=status,
+            message=message,
+            url=self.driver.current_url if self.driver else "",
+            elapsed=round(time.monotonic() - self._start, 3),
+            element_type=element_type,
+        )
         
         if status == "PASS":
             self.results["passed"].append(result)
@@ -114,22 +305,76 @@ class QuizMasterTester:
         else:
             self.results["warnings"].append(result)
         
-        print(f"[{status}] {test_name}: {message}")
+        if self._ndjson:
+            line = json.dumps(asdict(result)) + "\n"
+            with self._ndjson_lock:
+                self._ndjson.write(line)
+        
+        with self._out_lock:
+            self._out_buf.append(f"[{status}] {test_name}: {message}\n")
+            if len(self._out_buf) >= self.LOG_FLUSH_LINES:
+                sys.stdout.write("".join(self._out_buf))
+                self._out_buf.clear()
+
+    def flush_log(self):
+        """Write out buffered log lines; call before printing anything else so output stays in order"""
+        with self._out_lock:
+            sys.stdout.write("".join(self._out_buf))
+            self._out_buf.clear()
+        sys.stdout.flush()
     
-    def safe_click(self, element, test_name: str = "") -> bool:
-        """Safely click an element"""
+    def find_element(self, by: str, value: str, timeout: float = None):
+        """Find an element, waiting briefly for it to appear"""
+        if timeout is None:
+            timeout = self.FIND_TIMEOUT
+        return WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located((by, value)))
+
+    def open_page(self, url: str):
+        """Navigate to url; if loading times out, stop it and carry on with what has rendered"""
+        try:
+            self.driver.get(url)
+        except TimeoutException:
+            self.driver.execute_script("window.stop();")
+
+    def _wait_ready(self, timeout: float = 10):
+        """Wait until the current document has finished loading.
+
+        driver.get() returns at DOMContentLoaded (eager strategy), before the async Next.js chunks
+        have run; waiting for "complete" keeps interactions from reaching un-hydrated React forms.
+        """
+        WebDriverWait(self.driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+
+    def _wait_for_click_effect(self, element, url: str, timeout: float = None):
+        """Wait briefly for a click to navigate or re-render the element; no-op if nothing happens"""
+        if timeout is None:
+            timeout = self.CLICK_SETTLE_TIMEOUT
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda d: d.current_url != url or EC.staleness_of(element)(d)
+            )
+        except TimeoutException:
+            pass
+
+    def safe_click(self, element, test_name: str = "", settle: bool = True) -> bool:
+        """Safely click an element; with settle=False the caller waits for the click's effect itself"""
         try:
             # Scroll element into view
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)
+            url = self.driver.current_url
             
             # Try clicking
             element.click()
+            if settle:
+                self._wait_for_click_effect(element, url)
             return True
         except ElementClickInterceptedException:
             try:
                 # Try JavaScript click
                 self.driver.execute_script("arguments[0].click();", element)
+                if settle:
+                    self._wait_for_click_effect(element, url)
                 return True
             except Exception as e:
                 if test_name:
@@ -140,25 +385,43 @@ class QuizMasterTester:
                 self.log_result(test_name, "FAIL", f"Error clicking element: {str(e)}")
             return False
     
-    def find_and_test_elements(self, selector: str, element_type: str, test_name_prefix: str = "") -> List:
-        """Find all elements matching selector and test them"""
+    def _js_type(self, element, value: str):
+        """Fill a field with value in one WebDriver call instead of one keystroke per character"""
+        self.driver.execute_script(self.JS_TYPE_SCRIPT, element, value)
+
+    def find_and_test_elements(self, selector: str, element_type: str, test_name_prefix: str = "",
+                               record: bool = True,
+                               tag_kinds: Dict[str, Tuple[str, str, str]] = None) -> List:
+        """Find all visible, enabled elements matching selector; returns (element, test_name, info) tuples.
+
+        tag_kinds lets one union selector cover several kinds of element: it maps a tag name to the
+        (element_type, test_name_prefix, selector) to report for it, with a separate index per kind,
+        so names and tested_elements match separate per-kind queries. With record=False the
+        elements are not added to tested_elements (used when re-querying a page).
+        """
         found_elements = []
+        default_kind = (element_type, test_name_prefix, selector)
+        counts = {}
         try:
-            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-            for i, element in enumerate(elements):
-                try:
-                    if element.is_displayed() and element.is_enabled():
-                        test_name = f"{test_name_prefix}_{element_type}_{i+1}"
-                        found_elements.append((element, test_name))
-                        self.results["tested_elements"].append({
-                            "type": element_type,
-                            "selector": selector,
-                            "index": i,
-                            "text": element.text[:50] if element.text else "",
-                            "url": self.driver.current_url
-                        })
-                except Exception:
-                    pass
+            infos = self.driver.execute_script(self.ELEMENT_INFO_SCRIPT, selector) or []
+            url = self.driver.current_url
+            for info in infos:
+                kind = tag_kinds.get(info["tag"], default_kind) if tag_kinds else default_kind
+                i = counts.get(kind, 0)
+                counts[kind] = i + 1
+                if info["visible"] and info["enabled"]:
+                    etype, prefix, kind_selector = kind
+                    test_name = f"{prefix}_{etype}_{i+1}"
+                    found_elements.append((info["el"], test_name, info))
+                    if not record:
+                        continue
+                    self.results["tested_elements"].append({
+                        "type": etype,
+                        "selector": kind_selector,
+                        "index": i,
+                        "text": info["text"],
+                        "url": url
+                    })
         except Exception as e:
             self.log_result(f"{test_name_prefix}_find_{element_type}", "WARN", f"Could not find elements: {str(e)}")
         return found_elements
@@ -166,8 +429,9 @@ class QuizMasterTester:
     def test_page_load(self, url: str, expected_title: str = None) -> bool:
         """Test if a page loads successfully"""
         try:
-            self.driver.get(url)
-            time.sleep(2)  # Wait for page to load
+            self.open_page(url)
+            self._wait_ready()
+            self.wait.until(EC.presence_of_element_located(self.BODY))
             
             if expected_title:
                 if expected_title.lower() in self.driver.title.lower():
@@ -182,33 +446,90 @@ class QuizMasterTester:
             self.log_result(f"Page Load: {url}", "FAIL", f"Failed to load page: {str(e)}")
             return False
     
+    def _first_run(self, action: str) -> bool:
+        """Record that action runs on the current page; False if it already ran there"""
+        key = (_canon(self.driver.current_url), action)
+        with self._done_lock:
+            if key in self._done:
+                return False
+            self._done.add(key)
+            return True
+
+    def _reset_tested_pages(self):
+        """Forget which pages were exercised; the same URL renders differently for another account"""
+        with self._page_sigs_lock:
+            self._page_sigs.clear()
+        with self._done_lock:
+            self._done.clear()
+
+    def _query_buttons(self, record: bool = True) -> List:
+        """Clickable buttons and button-styled links on the current page, in one DOM query"""
+        return self.find_and_test_elements(
+            "button, a[role='button'], a.button", "button", "buttons", record,
+            tag_kinds={
+                "button": ("button", "buttons", "button"),
+                "a": ("link_button", "link_buttons", "a[role='button'], a.button"),
+            },
+        )
+
+    def _wait_for_button_effect(self, url: str, body) -> str:
+        """Classify what a button click did: 'navigated', 'dialog' or 'none'"""
+        try:
+            WebDriverWait(self.driver, self.BUTTON_EFFECT_TIMEOUT).until(
+                lambda d: d.current_url != url or EC.staleness_of(body)(d)
+                or d.execute_script("return !!document.querySelector('[role=dialog]')")
+            )
+        except TimeoutException:
+            return "none"
+        if self.driver.current_url != url or EC.staleness_of(body)(self.driver):
+            return "navigated"
+        return "dialog"
+
     def test_all_buttons(self):
-        """Test all buttons on current page"""
-        buttons = self.find_and_test_elements("button", "button", "buttons")
-        links_as_buttons = self.find_and_test_elements("a[role='button'], a.button", "link_button", "link_buttons")
-        
-        all_buttons = buttons + links_as_buttons
-        
-        for element, test_name in all_buttons:
+        """Test all buttons on current page.
+
+        After each click the page is checked once: a navigation is undone with back() and the
+        button list re-queried (old references are stale), and an opened dialog is closed with ESC.
+        """
+        if not self._first_run("buttons"):
+            return
+        all_buttons = self._query_buttons()
+
+        i = 0
+        while i < len(all_buttons):
+            element, test_name, info = all_buttons[i]
+            i += 1
+            if self.DESTRUCTIVE_BUTTON_RE.search(info["text"]):
+                continue
             try:
-                if self.safe_click(element, test_name):
-                    time.sleep(1)  # Wait for action to complete
-                    self.log_result(test_name, "PASS", f"Button clicked successfully: {element.text[:30]}")
-                else:
+                url = self.driver.current_url
+                body = self.driver.execute_script("return document.body")
+                if not self.safe_click(element, test_name, settle=False):
                     self.log_result(test_name, "FAIL", "Button click failed")
+                    continue
+                self.log_result(test_name, "PASS", f"Button clicked successfully: {info['text'][:30]}")
+
+                effect = self._wait_for_button_effect(url, body)
+                if effect == "navigated":
+                    self.driver.back()
+                    self._wait_ready()
+                    all_buttons = self._query_buttons(record=False)
+                elif effect == "dialog":
+                    ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
             except Exception as e:
                 self.log_result(test_name, "FAIL", f"Error testing button: {str(e)}")
     
     def test_all_links(self):
         """Test all links on current page"""
+        if not self._first_run("links"):
+            return
         links = self.find_and_test_elements("a[href]", "link", "links")
         
-        for element, test_name in links:
+        for element, test_name, info in links:
             try:
-                href = element.get_attribute("href")
+                href = info["href"]
                 if href and href.startswith(self.base_url):
                     if self.safe_click(element, test_name):
-                        time.sleep(1)
                         self.log_result(test_name, "PASS", f"Link clicked: {href}")
                     else:
                         self.log_result(test_name, "FAIL", f"Link click failed: {href}")
@@ -218,91 +539,226 @@ class QuizMasterTester:
     def login(self, email: str, password: str) -> bool:
         """Login using provided credentials and wait for redirect away from /auth/login"""
         try:
-            self.driver.get(f"{self.base_url}/auth/login")
-            email_input = self.wait.until(EC.presence_of_element_located((By.ID, "email")))
-            password_input = self.driver.find_element(By.ID, "password")
-            email_input.clear(); email_input.send_keys(email)
-            password_input.clear(); password_input.send_keys(password)
-            submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+            self.open_page(f"{self.base_url}/auth/login")
+            self._wait_ready()
+            email_input = self.wait.until(EC.presence_of_element_located(self.EMAIL_INPUT))
+            password_input = self.find_element(*self.PASSWORD_INPUT)
+            self._js_type(email_input, email)
+            self._js_type(password_input, password)
+            submit_btn = self.find_element(*self.SUBMIT_BUTTON)
             self.safe_click(submit_btn, "Login Submit")
             # Wait for navigation away from login
             self.wait.until(EC.url_changes(f"{self.base_url}/auth/login"))
-            time.sleep(2)
             # Basic sanity: should not be on login page
             if "/auth/login" in self.driver.current_url:
                 self.log_result("Login", "FAIL", "Still on login page after submit")
                 return False
             self.log_result("Login", "PASS", f"Logged in as {email}")
+            self.save_session(email)
             return True
         except Exception as e:
             self.log_result("Login", "FAIL", f"Login failed for {email}: {str(e)}")
             return False
 
-    def try_logout(self):
-        """Attempt to logout by clicking any visible Logout button"""
+    def _session_file(self, email: str) -> str:
+        return f".cookies_{email}.json"
+
+    def save_session(self, email: str):
+        """Save the current session cookies so later runs can skip the login form"""
+        try:
+            with open(self._session_file(email), "w") as f:
+                json.dump({"cookies": self.driver.get_cookies(), "ts": time.time()}, f)
+        except Exception as e:
+            self.log_result("Save Session", "WARN", f"Could not save session for {email}: {str(e)}")
+
+    def login_from_cache(self, email: str, landing_path: str) -> bool:
+        """Restore a saved session for email and check that landing_path opens without a redirect"""
         try:
-            # Try common logout buttons
-            candidates = self.driver.find_elements(By.XPATH, "//button[normalize-space()='Logout'] | //a[normalize-space()='Logout']")
-            for el in candidates:
-                if el.is_displayed():
-                    if self.safe_click(el, "Logout"):
-                        time.sleep(2)
-                        self.log_result("Logout", "PASS", "Clicked Logout")
-                        return True
+            with open(self._session_file(email)) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if time.time() - saved.get("ts", 0) >= self.SESSION_CACHE_TTL:
+            return False
+        try:
+            # Cookies can only be set for the domain that is currently open
+            self.open_page(self.base_url)
+            for cookie in saved.get("cookies", []):
+                self.driver.add_cookie(cookie)
+            self.open_page(f"{self.base_url}{landing_path}")
+            self._wait_ready()
+            if landing_path not in self.driver.current_url:
+                # Expired or revoked session: the page redirected to /auth/login (or home)
+                self.driver.delete_all_cookies()
+                return False
+            self.log_result("Login", "PASS", f"Restored saved session for {email}")
+            return True
         except Exception:
-            pass
-        # As a fallback, navigate to login page which typically redirects if logged in
+            return False
+
+    def login_or_restore(self, email: str, password: str, landing_path: str) -> bool:
+        """Reuse a saved session for email if it is still valid, otherwise log in through the form"""
+        return self.login_from_cache(email, landing_path) or self.login(email, password)
+
+    def create_worker(self, cookies: List[Dict], index: int) -> "QuizMasterTester":
+        """Create a headless tester with its own browser and profile, signed in with the given session cookies"""
+        worker = QuizMasterTester(self.base_url)
+        worker.driver = self.create_driver(headless=True, profile_dir=f".chrome-profile-{index}")
+        worker.wait = WebDriverWait(worker.driver, 10)
+        worker._page_sigs = self._page_sigs
+        worker._page_sigs_lock = self._page_sigs_lock
+        worker._done = self._done
+        worker._done_lock = self._done_lock
+        worker._ndjson = self._ndjson
+        worker._ndjson_lock = self._ndjson_lock
+        worker._start = self._start
+        worker._out_buf = self._out_buf
+        worker._out_lock = self._out_lock
         try:
-            self.driver.get(f"{self.base_url}/auth/login")
-            time.sleep(1)
+            # Cookies can only be set for the domain that is currently open
+            worker.open_page(self.base_url)
         except Exception:
-            pass
-        return False
+            # The worker is not handed back to the caller, so nobody else would quit its browser
+            worker.driver.quit()
+            raise
+        rejected = []
+        for cookie in cookies:
+            try:
+                worker.driver.add_cookie(cookie)
+            except Exception:
+                rejected.append(cookie.get("name", "?"))
+        if rejected:
+            # Without its session cookies the worker crawls logged out and gets redirected
+            worker.log_result("Worker Session", "WARN",
+                              f"Worker {index} could not set cookies: {', '.join(rejected)}")
+        return worker
+
+    def merge_results(self, results: Dict):
+        """Merge results collected by a worker tester into this tester's results"""
+        for key in ("passed", "failed", "warnings", "tested_elements"):
+            self.results[key].extend(results[key])
+
+    def visit_and_test_page(self, url: str, visited: set) -> Tuple[bool, List[str]]:
+        """Visit a page, interact with it and return (success, new internal links found on it)"""
+        new_links = []
+        new_keys = set()
+        try:
+            self.open_page(url)
+            self._wait_ready()
+            self.log_result("Explore Page", "PASS", f"Visited {url}")
+
+            # Interact with elements on this page, unless an identical page was already tested
+            sig = self.driver.execute_script(self.PAGE_SIGNATURE_SCRIPT)
+            with self._page_sigs_lock:
+                seen = sig in self._page_sigs
+                self._page_sigs.add(sig)
+            if not seen:
+                self.test_all_buttons()
+                self.test_all_inputs()
+
+            # Collect new internal links (limit per page to avoid explosion)
+            for href in self.driver.execute_script(self.LINK_HREFS_SCRIPT) or []:
+                if len(new_links) >= 20:
+                    break
+                try:
+                    # Visit the link as written (queries can matter to the route), minus the
+                    # fragment; dedup on its canonical form
+                    link = urldefrag(href).url
+                    key = _canon(link)
+                except ValueError:
+                    # e.g. a malformed netloc; skip this href, not the whole page
+                    continue
+                if (key.startswith(self.base_url) and key not in visited and key not in new_keys
+                        and not key.lower().endswith(self.ASSET_EXTENSIONS)):
+                    new_keys.add(key)
+                    new_links.append(link)
+            return True, new_links
+        except Exception as e:
+            self.log_result("Explore Page", "WARN", f"Error visiting {url}: {str(e)}")
+            return False, new_links
 
     def explore_authenticated_site(self, start_paths: list[str], max_depth: int = 3, max_pages: int = 50):
-        """Breadth-first exploration of internal links, clicking buttons and links on each page."""
+        """Breadth-first exploration of internal links, clicking buttons and links on each page.
+
+        Each BFS level is visited in parallel by headless worker browsers (WORKERS env, default
+        one per CPU) that reuse the current session's cookies.
+        """
+        import itertools
+        import os
         from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
         visited = set()
+        # visited and seen hold canonical URLs (see _canon); the queue holds the URLs to load.
+        # seen covers every URL ever enqueued, so a link found on many pages is queued once
+        seen = set()
         queue = deque()
-        for p in start_paths:
-            queue.append(self.base_url + p if p.startswith('/') else p)
 
-        pages_explored = 0
-        while queue and pages_explored < max_pages:
-            url = queue.popleft()
-            if url in visited or not url.startswith(self.base_url):
-                continue
-            visited.add(url)
+        def enqueue(url: str):
+            key = _canon(url)
+            if key not in seen:
+                seen.add(key)
+                queue.append(urldefrag(url).url)
 
-            try:
-                self.driver.get(url)
-                time.sleep(1.5)
-                self.log_result("Explore Page", "PASS", f"Visited {url}")
+        for p in start_paths:
+            enqueue(self.base_url + p if p.startswith('/') else p)
 
-                # Interact with elements on this page
-                self.test_all_buttons()
-                self.test_all_inputs()
+        cookies = self.driver.get_cookies()
+        max_workers = max(1, int(os.environ.get("WORKERS", os.cpu_count() or 1)))
+        local = threading.local()
+        workers = []
+        workers_lock = threading.Lock()
+        worker_ids = itertools.count()
 
-                # Collect new internal links (limit per page to avoid explosion)
-                link_els = self.driver.find_elements(By.CSS_SELECTOR, "a[href]")
-                new_links_added = 0
-                for a in link_els:
-                    try:
-                        href = a.get_attribute("href") or ""
-                        if href.startswith(self.base_url) and href not in visited and new_links_added < 20:
-                            queue.append(href)
-                            new_links_added += 1
-                    except Exception:
-                        continue
+        def visit(url: str) -> Tuple[bool, List[str], str]:
+            # One worker browser per pool thread, created on first use
+            worker = getattr(local, "worker", None)
+            if worker is None:
+                try:
+                    worker = self.create_worker(cookies, next(worker_ids))
+                except Exception as e:
+                    return False, [], f"Could not start worker browser for {url}: {str(e)}"
+                local.worker = worker
+                with workers_lock:
+                    workers.append(worker)
+            ok, links = worker.visit_and_test_page(url, visited)
+            return ok, links, ""
 
-                pages_explored += 1
-            except Exception as e:
-                self.log_result("Explore Page", "WARN", f"Error visiting {url}: {str(e)}")
+        pages_explored = 0
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                while queue and pages_explored < max_pages:
+                    batch = []
+                    while queue and len(batch) < max_pages - pages_explored:
+                        url = queue.popleft()
+                        key = _canon(url)
+                        if key in visited or not key.startswith(self.base_url):
+                            continue
+                        visited.add(key)
+                        batch.append(url)
+
+                    for ok, links, error in executor.map(visit, batch):
+                        if error:
+                            self.log_result("Explore Page", "WARN", error)
+                        if ok:
+                            pages_explored += 1
+                        for link in links:
+                            enqueue(link)
+        finally:
+            for worker in workers:
+                self.merge_results(worker.results)
+                try:
+                    worker.driver.quit()
+                except Exception:
+                    pass
 
     def run_authenticated_flows(self):
         """Login as teacher and student sequentially and explore their areas."""
+        # Accounts are switched by clearing cookies rather than clicking Logout: the app's Logout
+        # revokes the session server-side, which would invalidate the saved session for next run
+
         # Teacher flow
-        if self.login("kanishkjain03082005@gmail.com", "1234567"):
+        self._reset_tested_pages()
+        if self.login_or_restore("kanishkjain03082005@gmail.com", "1234567", "/teacher/dashboard"):
             # Prioritize teacher pages
             self.explore_authenticated_site([
                 "/teacher/dashboard",
@@ -312,68 +768,72 @@ class QuizMasterTester:
                 "/student/dashboard",
                 "/student/join-quiz",
             ], max_depth=2, max_pages=10)
-            self.try_logout()
+            self.driver.delete_all_cookies()
 
         # Student flow
-        if self.login("kanishkjaincloud@gmail.com", "12345678"):
+        self._reset_tested_pages()
+        if self.login_or_restore("kanishkjaincloud@gmail.com", "12345678", "/student/dashboard"):
             self.explore_authenticated_site([
                 "/student/dashboard",
                 "/student/join-quiz",
             ], max_depth=3, max_pages=40)
             # Visit a likely quiz page if reachable via links (crawler handles it)
-            self.try_logout()
+            self.driver.delete_all_cookies()
     
     def test_all_inputs(self):
         """Test all input fields on current page"""
+        if not self._first_run("inputs"):
+            return
         inputs = self.find_and_test_elements("input, textarea, select", "input", "inputs")
         
-        for element, test_name in inputs:
+        for element, test_name, info in inputs:
             try:
-                input_type = element.get_attribute("type") or "text"
-                input_name = element.get_attribute("name") or element.get_attribute("id") or "unknown"
+                # Metadata comes from the batch lookup; the element itself is only touched to type
+                input_type = info["type"] or "text"
+                input_name = info["name"] or info["id"] or "unknown"
                 
-                # Skip hidden inputs
+                # Skip hidden inputs (find_and_test_elements only returns visible ones)
                 if input_type == "hidden":
                     continue
                 
-                if element.is_displayed():
-                    element.clear()
-                    test_value = "test_input_value"
-                    
-                    if input_type == "email":
-                        test_value = "test@example.com"
-                    elif input_type == "password":
-                        test_value = "testpassword123"
-                    elif input_type == "number":
-                        test_value = "10"
-                    
-                    element.send_keys(test_value)
-                    time.sleep(0.5)
-                    
-                    self.log_result(test_name, "PASS", f"Input field filled: {input_name} (type: {input_type})")
+                test_value = "test_input_value"
+                
+                if input_type == "email":
+                    test_value = "test@example.com"
+                elif input_type == "password":
+                    test_value = "testpassword123"
+                elif input_type == "number":
+                    test_value = "10"
+                
+                self._js_type(element, test_value)
+                
+                self.log_result(test_name, "PASS", f"Input field filled: {input_name} (type: {input_type})")
             except Exception as e:
                 self.log_result(test_name, "FAIL", f"Error testing input: {str(e)}")
     
     def test_all_forms(self):
         """Test form submission"""
+        if not self._first_run("forms"):
+            return
         forms = self.find_and_test_elements("form", "form", "forms")
         
-        for element, test_name in forms:
+        for element, test_name, info in forms:
             try:
-                # Find all inputs in form and fill them
-                inputs = element.find_elements(By.CSS_SELECTOR, "input, textarea, select")
-                for inp in inputs:
+                # Find all inputs in form, with their metadata in one round trip, and fill them
+                inputs = self.driver.execute_script(self.FORM_INPUTS_SCRIPT, element) or []
+                for field in inputs:
+                    inp = field["el"]
                     try:
-                        if inp.is_displayed() and inp.get_attribute("type") != "hidden":
-                            inp_type = inp.get_attribute("type") or "text"
+                        if field["visible"] and field["type"] != "hidden":
+                            inp_type = field["type"] or "text"
                             if inp_type == "email":
-                                inp.send_keys("test@example.com")
+                                self._js_type(inp, "test@example.com")
                             elif inp_type == "password":
-                                inp.send_keys("testpassword123")
+                                self._js_type(inp, "testpassword123")
                             elif inp_type == "number":
-                                inp.send_keys("10")
+                                self._js_type(inp, "10")
                             else:
-                                inp.send_keys("test")
+                                self._js_type(inp, "test")
                     except Exception:
                         pass
                 
@@ -382,7 +842,6 @@ class QuizMasterTester:
                 if submit_buttons:
                     submit_btn = submit_buttons[0]
                     if self.safe_click(submit_btn, f"{test_name}_submit"):
-                        time.sleep(2)
                         self.log_result(f"{test_name}_submit", "PASS", "Form submitted")
                     else:
                         self.log_result(f"{test_name}_submit", "FAIL", "Form submit button click failed")
@@ -397,8 +856,6 @@ class QuizMasterTester:
         if not self.test_page_load(self.base_url, "QuizMaster"):
             return
         
-        time.sleep(2)
-        
         # Test all elements on homepage
         self.test_all_buttons()
         self.test_all_links()
@@ -410,22 +867,18 @@ class QuizMasterTester:
         if not self.test_page_load(f"{self.base_url}/auth/login", "Login"):
             return
         
-        time.sleep(2)
-        
         # Test login form
         try:
-            email_input = self.wait.until(EC.presence_of_element_located((By.ID, "email")))
-            password_input = self.driver.find_element(By.ID, "password")
+            email_input = self.wait.until(EC.presence_of_element_located(self.EMAIL_INPUT))
+            password_input = self.find_element(*self.PASSWORD_INPUT)
             
-            email_input.clear()
-            email_input.send_keys("test@example.com")
-            password_input.clear()
-            password_input.send_keys("testpassword123")
+            self._js_type(email_input, "test@example.com")
+            self._js_type(password_input, "testpassword123")
             
             self.log_result("Login Form Fill", "PASS", "Login form filled successfully")
             
             # Test submit button
-            submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+            submit_btn = self.find_element(*self.SUBMIT_BUTTON)
             if submit_btn:
                 self.log_result("Login Submit Button", "PASS", "Submit button found and clickable")
                 # Don't actually submit to avoid authentication errors
@@ -441,9 +894,8 @@ class QuizMasterTester:
         
         # Test sign up link
         try:
-            signup_link = self.driver.find_element(By.LINK_TEXT, "Sign up here")
+            signup_link = self.find_element(By.LINK_TEXT, "Sign up here")
             if self.safe_click(signup_link, "Sign Up Link"):
-                time.sleep(2)
                 self.log_result("Sign Up Link", "PASS", "Sign up link works")
         except Exception as e:
             self.log_result("Sign Up Link", "FAIL", f"Error: {str(e)}")
@@ -454,24 +906,18 @@ class QuizMasterTester:
         if not self.test_page_load(f"{self.base_url}/auth/sign-up", "Sign Up"):
             return
         
-        time.sleep(2)
-        
         # Test signup form
         try:
             fullname_input = self.wait.until(EC.presence_of_element_located((By.ID, "fullName")))
-            email_input = self.driver.find_element(By.ID, "email")
-            role_select = self.driver.find_element(By.ID, "role")
-            password_input = self.driver.find_element(By.ID, "password")
-            repeat_password_input = self.driver.find_element(By.ID, "repeatPassword")
+            email_input = self.find_element(*self.EMAIL_INPUT)
+            role_select = self.find_element(By.ID, "role")
+            password_input = self.find_element(*self.PASSWORD_INPUT)
+            repeat_password_input = self.find_element(By.ID, "repeatPassword")
             
-            fullname_input.clear()
-            fullname_input.send_keys("Test User")
-            email_input.clear()
-            email_input.send_keys(f"test{int(time.time())}@example.com")
-            password_input.clear()
-            password_input.send_keys("testpassword123")
-            repeat_password_input.clear()
-            repeat_password_input.send_keys("testpassword123")
+            self._js_type(fullname_input, "Test User")
+            self._js_type(email_input, f"test{int(time.time())}@example.com")
+            self._js_type(password_input, "testpassword123")
+            self._js_type(repeat_password_input, "testpassword123")
             
             self.log_result("Signup Form Fill", "PASS", "Signup form filled successfully")
             
@@ -480,7 +926,7 @@ class QuizMasterTester:
                 self.log_result("Role Select", "PASS", "Role select found")
             
             # Test submit button
-            submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+            submit_btn = self.find_element(*self.SUBMIT_BUTTON)
             if submit_btn:
                 self.log_result("Signup Submit Button", "PASS", "Submit button found")
                 # Don't actually submit to avoid creating test accounts
@@ -496,9 +942,8 @@ class QuizMasterTester:
         
         # Test login link
         try:
-            login_link = self.driver.find_element(By.LINK_TEXT, "Login")
+            login_link = self.find_element(By.LINK_TEXT, "Login")
             if self.safe_click(login_link, "Login Link from Signup"):
-                time.sleep(2)
                 self.log_result("Login Link from Signup", "PASS", "Login link works")
         except Exception as e:
             self.log_result("Login Link from Signup", "FAIL", f"Error: {str(e)}")
@@ -509,8 +954,6 @@ class QuizMasterTester:
         if not self.test_page_load(f"{self.base_url}/student/dashboard"):
             return
         
-        time.sleep(3)
-        
         # Check if redirected to login (expected if not authenticated)
         if "login" in self.driver.current_url.lower():
             self.log_result("Student Dashboard Auth", "WARN", "Redirected to login (authentication required)")
@@ -523,11 +966,10 @@ class QuizMasterTester:
         
         # Test tabs
         try:
-            tabs = self.driver.find_elements(By.CSS_SELECTOR, "[role='tab'], button[data-state]")
+            tabs = self.driver.find_elements(*self.TABS)
             for tab in tabs:
                 if tab.is_displayed():
                     self.safe_click(tab, "Tab Click")
-                    time.sleep(1)
         except Exception:
             pass
         
@@ -544,8 +986,6 @@ class QuizMasterTester:
         if not self.test_page_load(f"{self.base_url}/teacher/dashboard"):
             return
         
-        time.sleep(3)
-        
         # Check if redirected to login
         if "login" in self.driver.current_url.lower():
             self.log_result("Teacher Dashboard Auth", "WARN", "Redirected to login (authentication required)")
@@ -558,18 +998,18 @@ class QuizMasterTester:
         
         # Test tabs
         try:
-            tabs = self.driver.find_elements(By.CSS_SELECTOR, "[role='tab'], button[data-state]")
+            tabs = self.driver.find_elements(*self.TABS)
             for tab in tabs:
                 if tab.is_displayed():
                     self.safe_click(tab, "Tab Click")
-                    time.sleep(1)
         except Exception:
             pass
         
         # Test create quiz button
         try:
-            create_btn = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Create')]")
-            if create_btn:
+            create_btns = (self.driver.find_elements(*self.CREATE_QUIZ_BUTTON)
+                           or self.driver.find_elements(*self.CREATE_QUIZ_BUTTON_FALLBACK))
+            if create_btns:
                 self.log_result("Create Quiz Button", "PASS", "Create quiz button found")
         except Exception:
             pass
@@ -580,13 +1020,10 @@ class QuizMasterTester:
         if not self.test_page_load(f"{self.base_url}/student/join-quiz"):
             return
         
-        time.sleep(2)
-        
         # Test join code input
         try:
             join_code_input = self.wait.until(EC.presence_of_element_located((By.ID, "joinCode")))
-            join_code_input.clear()
-            join_code_input.send_keys("TEST01")
+            self._js_type(join_code_input, "TEST01")
             self.log_result("Join Code Input", "PASS", "Join code input works")
         except Exception as e:
             self.log_result("Join Code Input", "FAIL", f"Error: {str(e)}")
@@ -611,71 +1048,60 @@ class QuizMasterTester:
             try:
                 self.log_result(f"Testing {name}", "INFO", f"Accessing {path}")
                 self.test_page_load(f"{self.base_url}{path}")
-                time.sleep(2)
                 
                 # Test all interactive elements on each page
                 self.test_all_buttons()
                 self.test_all_links()
                 self.test_all_inputs()
                 self.test_all_forms()
-                
-                time.sleep(1)
             except Exception as e:
                 self.log_result(f"Testing {name}", "FAIL", f"Error: {str(e)}")
     
     def generate_report(self):
         """Generate comprehensive test report"""
-        total_tests = len(self.results["passed"]) + len(self.results["failed"]) + len(self.results["warnings"])
-        pass_rate = (len(self.results["passed"]) / total_tests * 100) if total_tests > 0 else 0
-        
-        report = f"""
-{'='*80}
-QUIZMASTER COMPREHENSIVE TEST REPORT
-{'='*80}
-Generated: {self.results['timestamp']}
-Base URL: {self.base_url}
+        self.flush_log()
+        passed, failed, warnings = self.results["passed"], self.results["failed"], self.results["warnings"]
+        total_tests = len(passed) + len(failed) + len(warnings)
 
-SUMMARY:
---------
-Total Tests: {total_tests}
-Passed: {len(self.results['passed'])} ({len(self.results['passed'])/total_tests*100:.1f}%)
-Failed: {len(self.results['failed'])} ({len(self.results['failed'])/total_tests*100:.1f}%)
-Warnings: {len(self.results['warnings'])} ({len(self.results['warnings'])/total_tests*100:.1f}%)
-Pass Rate: {pass_rate:.1f}%
+        def pct(n: int) -> float:
+            return n / total_tests * 100 if total_tests > 0 else 0
 
-Elements Tested: {len(self.results['tested_elements'])}
+        passed_lines = [f"✓ {t.test}: {t.message}\n" for t in passed[:20]]  # Show first 20
+        if len(passed) > 20:
+            passed_lines.append(f"... and {len(passed) - 20} more passed tests\n")
+        failed_lines = [
+            f"✗ {t.test}: {t.message}\n" + (f"  URL: {t.url}\n" if t.url else "") for t in failed
+        ]
+        warning_lines = [f"⚠ {t.test}: {t.message}\n" for t in warnings]
 
-PASSED TESTS ({len(self.results['passed'])}):
---------------
-"""
-        for test in self.results["passed"][:20]:  # Show first 20
-            report += f"✓ {test['test']}: {test['message']}\n"
-        if len(self.results["passed"]) > 20:
-            report += f"... and {len(self.results['passed']) - 20} more passed tests\n"
-        
-        report += f"\nFAILED TESTS ({len(self.results['failed'])}):\n"
-        report += "---------------\n"
-        for test in self.results["failed"]:
-            report += f"✗ {test['test']}: {test['message']}\n"
-            if test['url']:
-                report += f"  URL: {test['url']}\n"
-        
-        report += f"\nWARNINGS ({len(self.results['warnings'])}):\n"
-        report += "---------\n"
-        for test in self.results["warnings"]:
-            report += f"⚠ {test['test']}: {test['message']}\n"
-        
-        report += f"\n{'='*80}\n"
-        
-        # Save to file
-        filename = f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        report = self.REPORT_TEMPLATE.format(
+            rule="=" * 80,
+            generated=self.results["timestamp"],
+            base_url=self.base_url,
+            total=total_tests,
+            passed=len(passed), passed_pct=pct(len(passed)),
+            failed=len(failed), failed_pct=pct(len(failed)),
+            warnings=len(warnings), warnings_pct=pct(len(warnings)),
+            pass_rate=pct(len(passed)),
+            elements=len(self.results["tested_elements"]),
+            passed_lines="".join(passed_lines),
+            failed_lines="".join(failed_lines),
+            warning_lines="".join(warning_lines),
+        )
+        
+        # Save to file; both reports share one timestamp so their names match
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"test_report_{stamp}.txt"
         with open(filename, "w") as f:
             f.write(report)
         
         # Also save JSON
-        json_filename = f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        json_filename = f"test_report_{stamp}.json"
         with open(json_filename, "w") as f:
-            json.dump(self.results, f, indent=2)
+            results = dict(self.results)
+            for key in ("passed", "failed", "warnings"):
+                results[key] = [asdict(r) for r in self.results[key]]
+            json.dump(results, f, indent=2)
         
         print(report)
         print(f"\nReport saved to: {filename}")
@@ -685,6 +1111,9 @@ PASSED TESTS ({len(self.results['passed'])}):
     
     def run_all_tests(self):
         """Run authenticated flows for teacher and student, then general checks"""
+        # log_result batches its own writes; stop the console stream flushing on every newline
+        if hasattr(sys.stdout, "reconfigure"):
+            sys.stdout.reconfigure(line_buffering=False)
         if not self.setup_driver():
             print("Failed to setup driver. Exiting.")
             return False
@@ -695,29 +1124,35 @@ PASSED TESTS ({len(self.results['passed'])}):
             
             # Homepage smoke
             self.test_homepage()
-            time.sleep(1)
 
             # Authenticated exploration as requested
+            self.flush_log()
             print("\nRunning authenticated flows (teacher and student)...")
             self.run_authenticated_flows()
             
             # Generate report
+            self.flush_log()
             print("\nGenerating test report...")
             self.generate_report()
             
             return True
             
         except KeyboardInterrupt:
+            self.flush_log()
             print("\n\nTest interrupted by user")
             self.generate_report()
             return False
         except Exception as e:
+            self.flush_log()
             print(f"\n\nFatal error during testing: {str(e)}")
             import traceback
             traceback.print_exc()
             self.generate_report()
             return False
         finally:
+            self.flush_log()
+            if self._ndjson:
+                self._ndjson.close()
             if self.driver:
                 self.driver.quit()
                 print("\nBrowser closed.")